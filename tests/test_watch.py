@@ -0,0 +1,368 @@
+import io
+import itertools
+import json
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import urllib3
+from kubernetes import client
+
+import watch
+
+
+def _pod_event(event_type, name, rv):
+    """One line of a pod watch stream, as the API server sends it"""
+    pod = {"kind": "Pod", "metadata": {"name": name, "resourceVersion": rv}}
+    return json.dumps({"type": event_type, "object": pod}).encode() + b"\n"
+
+
+class IdleServer:
+    """Local HTTP server whose responses send one chunk and then go quiet for
+    idle_secs, like an idle watch or the log stream of a quiet container"""
+
+    def __init__(self, idle_secs=10):
+        self.idle_secs = idle_secs
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.url = "http://127.0.0.1:%d/" % self.sock.getsockname()[1]
+        self.pool = urllib3.PoolManager()
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            conn, _ = self.sock.accept()
+            threading.Thread(target=self._respond, args=(conn,), daemon=True).start()
+
+    def _respond(self, conn):
+        with conn:
+            conn.recv(65536)
+            conn.sendall(
+                b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n" b"1\r\n\n\r\n"
+            )
+            time.sleep(self.idle_secs)
+            conn.sendall(b"0\r\n\r\n")
+
+    def open(self):
+        """A real urllib3 response, its stream blocks after the first newline"""
+        return self.pool.request("GET", self.url, preload_content=False)
+
+
+idle_server = IdleServer()
+
+
+class FakeWatchResponse:
+    """Stands in for the urllib3 response the client reads a watch from"""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def stream(self, amt=None, decode_content=True):
+        yield from self.chunks()
+
+    def shutdown(self):
+        pass
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+
+class FakeCoreV1Api:
+    """LISTs the given pods and answers each watch request with the next scripted
+    stream. Once the script runs out, watches and logs come from the idle server."""
+
+    def __init__(self, streams, list_error=None, pods=()):
+        self.streams = iter(streams)
+        self.pods = list(pods)
+        # Raised by every LIST after the first, which start() needs to succeed
+        self.list_error = list_error
+        self.requests = 0
+        self.lists = 0
+
+    def list_namespaced_pod(self, namespace, **kwargs):
+        """Watch reads the type of the events it decodes from this docstring
+
+        :rtype: V1PodList
+        """
+        self.requests += 1
+        if kwargs.get("watch"):
+            stream = next(self.streams, None)
+            return FakeWatchResponse(stream) if stream else idle_server.open()
+        self.lists += 1
+        if self.list_error and self.requests > 1:
+            raise self.list_error
+        return client.V1PodList(
+            items=self.pods, metadata=client.V1ListMeta(resource_version="1")
+        )
+
+    def read_namespaced_pod_log(self, **kwargs):
+        return idle_server.open()
+
+
+class FakeBatchV1Api:
+    """Serves a single Job with containers a and b"""
+
+    def __init__(self, status=None):
+        self.job = client.V1Job(
+            metadata=client.V1ObjectMeta(name="pi", uid="1234", resource_version="1"),
+            spec=client.V1JobSpec(
+                template=client.V1PodTemplateSpec(
+                    spec=client.V1PodSpec(
+                        containers=[client.V1Container(name=n) for n in "ab"]
+                    )
+                )
+            ),
+            status=status or client.V1JobStatus(active=1),
+        )
+        self.watches = 0
+
+    def read_namespaced_job(self, name, namespace):
+        return self.job
+
+    def list_namespaced_job(self, namespace, **kwargs):
+        """Watches a dead connection first, then one that reports the Job active
+
+        :rtype: V1JobList
+        """
+        self.watches += 1
+        if self.watches == 1:
+            raise urllib3.exceptions.ReadTimeoutError(None, None, "Read timed out")
+        job = {"kind": "Job", "metadata": {"name": "pi", "resourceVersion": "2"}}
+        job["status"] = {"active": 1}
+        event = json.dumps({"type": "MODIFIED", "object": job}).encode() + b"\n"
+        return FakeWatchResponse(lambda: iter([event]))
+
+
+def make_watcher(test, core_client, batch_client=None):
+    """A JobWatcher for the Job served by batch_client, talking only to the fakes"""
+    for patcher in (
+        mock.patch.object(
+            watch,
+            "get_clients",
+            return_value=(batch_client or FakeBatchV1Api(), core_client),
+        ),
+        mock.patch.object(watch, "_ensure_pool_size"),
+    ):
+        patcher.start()
+        test.addCleanup(patcher.stop)
+    watcher = watch.JobWatcher("default", "pi")
+    test.addCleanup(watcher.close)
+    return watcher
+
+
+def _running_pod(*containers):
+    """A pod whose given containers are running, the others have no status yet"""
+    running = client.V1ContainerState(running=client.V1ContainerStateRunning())
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name="pi-abc", resource_version="1"),
+        status=client.V1PodStatus(
+            container_statuses=[
+                client.V1ContainerStatus(
+                    name=name,
+                    state=running,
+                    image="busybox",
+                    image_id="busybox",
+                    ready=True,
+                    restart_count=0,
+                )
+                for name in containers
+            ]
+        ),
+    )
+
+
+class PodCacheTest(unittest.TestCase):
+    def patch_clients(self, core_client):
+        patcher = mock.patch.object(
+            watch, "get_clients", return_value=(None, core_client)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def start_cache(self, core_client):
+        self.patch_clients(core_client)
+        pod_cache = watch._PodCache("default", "job-name=pi")
+        pod_cache.start()
+        # Make sure the watch thread is gone before the next test patches in its fake
+        self.addCleanup(pod_cache._thread.join, 5)
+        self.addCleanup(pod_cache.stop)
+        return pod_cache
+
+    def test_skips_blank_and_undecodable_events(self):
+        def stream():
+            yield b"\n"
+            yield b"not json\n"
+            yield _pod_event("ADDED", "pi-abc", "2")
+
+        pod_cache = self.start_cache(FakeCoreV1Api([stream]))
+
+        self.assertTrue(pod_cache.wait_for(pod_cache.first, timeout=5))
+        self.assertEqual(pod_cache.first().metadata.name, "pi-abc")
+        self.assertTrue(pod_cache._thread.is_alive())
+
+    def test_waiters_raise_when_the_watch_thread_dies(self):
+        class Crash(BaseException):
+            pass
+
+        def stream():
+            raise Crash()
+            yield
+
+        with mock.patch("threading.excepthook"):
+            pod_cache = self.start_cache(FakeCoreV1Api([stream]))
+            with self.assertRaises(watch.PodWatchError):
+                pod_cache.wait_for(lambda: False, timeout=5)
+            pod_cache._thread.join(5)
+
+    def assert_backs_off(self, core_client):
+        self.start_cache(core_client)
+        time.sleep(1)
+        # Without backoff this is thousands of requests a second
+        self.assertLess(core_client.requests, 10)
+
+    def test_backs_off_when_relisting_after_410_fails(self):
+        def gone():
+            raise watch.ApiException(status=410)
+            yield
+
+        self.assert_backs_off(
+            FakeCoreV1Api(
+                itertools.repeat(gone), list_error=watch.ApiException(status=429)
+            )
+        )
+
+    def test_backs_off_when_watches_close_straight_away(self):
+        self.assert_backs_off(FakeCoreV1Api(itertools.repeat(lambda: iter(()))))
+
+    def test_stop_ends_the_watch(self):
+        pod_cache = self.start_cache(FakeCoreV1Api([]))
+        # Let the thread settle into reading the idle watch
+        time.sleep(0.5)
+
+        started = time.monotonic()
+        pod_cache.stop()
+        pod_cache._thread.join(5)
+        self.assertLess(time.monotonic() - started, 2)
+        self.assertFalse(pod_cache._thread.is_alive())
+        with self.assertRaises(watch.PodWatchError):
+            pod_cache.wait_for(lambda: False)
+
+
+class JobWatcherTest(unittest.TestCase):
+    def test_concurrent_first_reads_start_one_cache(self):
+        core_client = FakeCoreV1Api([])
+        watcher = make_watcher(self, core_client)
+        list_pods = watch._PodCache._list
+
+        def slow_list(pod_cache):
+            # Hold the first reader in its LIST long enough for the others to arrive
+            time.sleep(0.2)
+            list_pods(pod_cache)
+
+        with mock.patch.object(watch._PodCache, "_list", slow_list):
+            readers = [
+                threading.Thread(target=lambda: watcher.pod_cache) for _ in range(4)
+            ]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join(5)
+
+        self.assertEqual(core_client.lists, 1)
+        pod_cache = watcher.pod_cache
+        watcher.close()
+        pod_cache._thread.join(5)
+        self.assertFalse(pod_cache._thread.is_alive())
+
+    def test_job_watch_resumes_after_a_read_timeout(self):
+        batch_client = FakeBatchV1Api(status=client.V1JobStatus())
+        watcher = make_watcher(self, FakeCoreV1Api([]), batch_client)
+
+        self.assertEqual(watcher.wait_for_active_job().status.active, 1)
+        self.assertEqual(batch_client.watches, 2)
+
+    def test_failed_follow_cancels_the_others(self):
+        # a never reports a status, b is running with a log stream that stays quiet
+        watcher = make_watcher(self, FakeCoreV1Api([], pods=[_running_pod("b")]))
+        follow = watcher.print_container_logs
+        watcher.print_container_logs = lambda **kwargs: follow(
+            pod_availability_timeout=0.5, **kwargs
+        )
+
+        started = time.monotonic()
+        with mock.patch("sys.stdout", io.TextIOWrapper(io.BytesIO())):
+            with self.assertRaises(watch.PodUnavailable):
+                watcher._follow_concurrently(watcher.containers)
+        # Without cancelling, b is waited on until its log stream next sends data
+        self.assertLess(time.monotonic() - started, 3)
+
+
+class PrefixLinesTest(unittest.TestCase):
+    def prefix(self, *chunks):
+        return list(watch._prefix_lines(iter(chunks), b"[a] "))
+
+    def test_prefixes_every_line_of_a_multi_line_chunk(self):
+        self.assertEqual(self.prefix(b"one\ntwo\n"), [b"[a] one\n[a] two\n"])
+
+    def test_holds_back_a_partial_line_until_its_newline(self):
+        self.assertEqual(
+            self.prefix(b"one\ntw", b"o\nthr", b"ee\n"),
+            [b"[a] one\n", b"[a] two\n", b"[a] three\n"],
+        )
+
+    def test_chunk_without_a_newline_yields_nothing(self):
+        self.assertEqual(self.prefix(b"on", b"e", b"\n"), [b"[a] one\n"])
+
+    def test_terminates_a_trailing_partial_line(self):
+        self.assertEqual(self.prefix(b"one\ntwo"), [b"[a] one\n", b"[a] two\n"])
+
+    def test_keeps_empty_lines(self):
+        self.assertEqual(self.prefix(b"\n\none\n"), [b"[a] \n[a] \n[a] one\n"])
+
+
+class JobIsActiveTest(unittest.TestCase):
+    def job(self, **status):
+        return client.V1Job(status=client.V1JobStatus(**status))
+
+    def finished(self, condition_type):
+        condition = client.V1JobCondition(type=condition_type, status="True")
+        return self.job(conditions=[condition])
+
+    def test_active_while_retrying_a_failed_pod(self):
+        self.assertTrue(watch._job_is_active(self.job(active=1, failed=1)))
+
+    def test_not_active_between_retries(self):
+        self.assertFalse(watch._job_is_active(self.job(failed=1)))
+
+    def test_raises_once_finished(self):
+        for condition_type in ("Complete", "Failed"):
+            with self.assertRaises(watch.NoActiveJob):
+                watch._job_is_active(self.finished(condition_type))
+
+
+class BackoffDelaysTest(unittest.TestCase):
+    def test_delays_stay_under_the_cap_and_jittered(self):
+        delays = list(itertools.islice(watch._backoff_delays(base=0.25, cap=5), 40))
+
+        self.assertTrue(all(0 < delay <= 5 for delay in delays))
+        # Well past the point where base * 2**attempt reaches the cap
+        plateau = delays[10:]
+        self.assertGreaterEqual(min(plateau), 2.5)
+        self.assertGreater(len(set(plateau)), 1)
+
+
+class MainTest(unittest.TestCase):
+    def test_rejects_max_log_requests_below_one(self):
+        argv = ["watch.py", "pi", "--max-log-requests", "0"]
+        with mock.patch("sys.argv", argv), mock.patch("sys.stderr", io.StringIO()):
+            with self.assertRaises(SystemExit) as exit:
+                watch.main()
+        self.assertEqual(exit.exception.code, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,21 +1,87 @@
 import argparse
-import pprint
+import json
+import random
 import sys
 import time
-from functools import partial
-from threading import Thread
-from typing import List, Optional
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache, wraps
+from threading import Condition, Event, Lock, RLock, Thread
+from typing import Dict, List, Optional, Tuple
 
 from kubernetes import client, config, watch
+from kubernetes.client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+
+@lru_cache(maxsize=1)
+def get_clients() -> Tuple["client.BatchV1Api", "client.CoreV1Api"]:
+    """Load the kubeconfig and build the API clients on first use, so importing
+    this module or running --help doesn't pay for kubeconfig parsing and TLS setup.
+
+    A single ApiClient (and so a single urllib3 connection pool) is shared by every API
+    wrapper so requests to the API server reuse warm keep-alive connections.
+    The pool is sized for the concurrent watch and log streams held open per Job.
+    """
+    config.load_kube_config()
+    api_config = client.Configuration.get_default_copy()
+    api_config.connection_pool_maxsize = 32
+    api_client = client.ApiClient(api_config)
+    # BatchV1Api provides access to Jobs https://kubernetes.io/docs/concepts/workloads/controllers/job/
+    # CoreV1API is the "default" k8s API with access to pods, namespaces, etc.
+    return client.BatchV1Api(api_client), client.CoreV1Api(api_client)
+
+
+# resourceVersion=0 lets the API server answer LISTs from its watch cache instead of a quorum read from etcd
+_list_kwargs = {"resource_version": "0"}
+# Upper bound on a single read from a followed log stream
+LOG_CHUNK_SIZE = 64 * 1024
+# Longest time followed log output may sit in stdout's buffer before being flushed
+LOG_FLUSH_SECS = 0.1
+# How long the API server keeps a pod watch open before we reconnect it
+WATCH_TIMEOUT_SECS = 300
+# A pod watch that ends sooner than this is backed off from rather than reopened at once
+WATCH_MIN_SECS = 5
+
+
+def _backoff_delays(base=0.25, cap=5.0):
+    """Yields exponentially growing retry delays in seconds, with jitter so that
+    many watchers retrying at once don't hit the API server in lockstep.
+    Jitter scales the capped delay down by up to half, so delays never exceed cap
+    and stay spread out once they reach it."""
+    attempt = 0
+    while True:
+        yield min(cap, base * 2**attempt) * random.uniform(0.5, 1.0)
+        attempt = min(attempt + 1, 32)
+
+
+def _watch_timeouts(timeout_seconds):
+    """Watch kwargs that bound a watch on both ends. The API server ends the watch
+    after timeout_seconds, and the client read timeout (with some slack) catches a
+    dead connection that would otherwise block forever."""
+    return {
+        "timeout_seconds": timeout_seconds,
+        "_request_timeout": timeout_seconds + 30,
+    }
+
+
+def _ensure_pool_size(size):
+    """Grow the shared connection pool so it holds at least `size` connections.
+    urllib3 discards connections beyond maxsize, which silently drops watch streams."""
+    _, core_client = get_clients()
+    pool_manager = core_client.api_client.rest_client.pool_manager
+    if pool_manager.connection_pool_kw.get("maxsize", 1) < size:
+        pool_manager.connection_pool_kw["maxsize"] = size
+        # Pools that already exist keep the maxsize they were built with
+        pool_manager.clear()
 
-config.load_kube_config()
 
-# CoreV1API is the "default" k8s API with access to pods, namespaces, etc.
-core_client = client.CoreV1Api()
-# BatchV1Api provides access to Jobs https://kubernetes.io/docs/concepts/workloads/controllers/job/
-batch_client = client.BatchV1Api()
-# Watch supports keeping a request open via long-polling
-watch_client = watch.Watch()
+def _close_stream(resp):
+    """Close a streamed response that another thread may be blocked reading.
+    close() alone waits for that read to return, which on an idle stream can take
+    until the server next sends data, so shut the socket down first to end it at once.
+    """
+    resp.shutdown()
+    resp.close()
 
 
 class WatcherException(Exception):
@@ -34,6 +100,10 @@ class ContainerLogTimeout(TimeoutError):
     pass
 
 
+class ContainerLogCancelled(WatcherException):
+    pass
+
+
 class JobError(WatcherException):
     pass
 
@@ -50,6 +120,294 @@ class PodUnavailable(JobError):
     pass
 
 
+class PodWatchError(WatcherException):
+    pass
+
+
+class _LogWriter:
+    """Writes log bytes from every followed container into stdout's buffer.
+
+    Instead of flushing after every chunk, a daemon thread flushes at most once
+    per flush_secs while there is unflushed output, so chatty containers cost one
+    write(2) per buffer-full or interval rather than one per chunk.
+    """
+
+    def __init__(self, flush_secs=LOG_FLUSH_SECS):
+        self.flush_secs = flush_secs
+        # Also serializes writes from concurrently followed log streams
+        self.lock = Lock()
+        self.dirty = Condition(self.lock)
+        self._pending = False
+        self._thread = None
+
+    def write(self, data):
+        with self.lock:
+            sys.stdout.buffer.write(data)
+            if not self._pending:
+                self._pending = True
+                self.dirty.notify()
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+    def flush(self):
+        with self.lock:
+            sys.stdout.buffer.flush()
+            self._pending = False
+
+    def _run(self):
+        while True:
+            with self.dirty:
+                self.dirty.wait_for(lambda: self._pending)
+            # Let more output collect before flushing it in one go
+            time.sleep(self.flush_secs)
+            self.flush()
+
+
+_log_writer = _LogWriter()
+
+
+class _LogFollows:
+    """Log follows running side by side. cancel() cuts them all short, so a
+    failure in one is reported without waiting for the other containers to exit."""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.cancelled = False
+        self._responses = set()
+
+    def add(self, resp):
+        with self.lock:
+            self._responses.add(resp)
+            cancelled = self.cancelled
+        if cancelled:
+            _close_stream(resp)
+
+    def discard(self, resp):
+        with self.lock:
+            self._responses.discard(resp)
+
+    def check(self):
+        """raises ContainerLogCancelled once cancel() has been called"""
+        if self.cancelled:
+            raise ContainerLogCancelled("Stopped following logs, another follow failed")
+
+    def cancel(self):
+        """Cancel every follow, closing the log streams they are blocked reading"""
+        with self.lock:
+            self.cancelled = True
+            responses = list(self._responses)
+        for resp in responses:
+            _close_stream(resp)
+
+
+class _PodCache:
+    """Local copy of the pods matching a label selector, kept current by a single Watch.
+
+    One LIST bootstraps the cache and records its resourceVersion, after which a
+    daemon thread applies watch events so lookups never go back to the API server.
+    Every applied change notifies `changed`, so callers can block on a state
+    transition with wait_for() instead of polling. stop() ends the watch and
+    closes its connection.
+    """
+
+    def __init__(self, namespace, label_selector, field_selector=None, page_size=16):
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.page_size = page_size
+        self.pods: Dict[str, "client.models.v1_pod.V1Pod"] = {}
+        # {pod_name: {status_field: {container_name: V1ContainerStatus}}}, rebuilt with each pod
+        self.statuses: Dict[str, dict] = {}
+        self.rv = None
+        # Set if the watch thread dies, so waiters fail instead of blocking forever
+        self.error = None
+        # Re-entrant so wait_for() predicates can read the cache while holding the lock
+        self.lock = RLock()
+        self.changed = Condition(self.lock)
+        self._stopped = Event()
+        self._thread = None
+        self._watch_resp = None
+
+    def start(self):
+        """Populate the cache and start the watch thread"""
+        self._list()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the watch thread and close its connection. Waiters raise PodWatchError"""
+        with self.lock:
+            self._stopped.set()
+            resp = self._watch_resp
+            self.changed.notify_all()
+        # Watch.stop() is only checked between events, so close the
+        # response the thread is blocked reading from instead
+        if resp is not None:
+            _close_stream(resp)
+
+    def _list(self):
+        """Rebuild the cache from a full LIST and reset the resourceVersion cursor"""
+        _, core_client = get_clients()
+        selectors = {"label_selector": self.label_selector}
+        if self.field_selector:
+            selectors["field_selector"] = self.field_selector
+
+        pod_list = core_client.list_namespaced_pod(
+            namespace=self.namespace, limit=self.page_size, **selectors, **_list_kwargs
+        )
+        pods = {pod.metadata.name: pod for pod in pod_list.items}
+        rv = pod_list.metadata.resource_version
+        # A Job rarely has more pods than fit in one page, but follow the
+        # continue token in case it does. resourceVersion may not be combined with continue.
+        while pod_list.metadata._continue:
+            pod_list = core_client.list_namespaced_pod(
+                namespace=self.namespace,
+                limit=self.page_size,
+                _continue=pod_list.metadata._continue,
+                **selectors,
+            )
+            pods.update((pod.metadata.name, pod) for pod in pod_list.items)
+
+        with self.lock:
+            self.pods = pods
+            self.statuses = {name: _index_statuses(pod) for (name, pod) in pods.items()}
+            self.rv = rv
+            self.changed.notify_all()
+
+    def _run(self):
+        try:
+            self._list_and_watch()
+        except BaseException as e:
+            with self.lock:
+                self.error = e
+                self.changed.notify_all()
+            raise
+
+    def _list_and_watch(self):
+        delays = _backoff_delays()
+        relist = False
+        while not self._stopped.is_set():
+            try:
+                if relist:
+                    self._list()
+                    relist = False
+                opened = time.monotonic()
+                self._watch()
+                if time.monotonic() - opened >= WATCH_MIN_SECS:
+                    # The API server ended the watch at timeout_seconds, resume from self.rv
+                    delays = _backoff_delays()
+                    continue
+                # A watch the server closes straight away is retried like a failed one
+            except ApiException as e:
+                # 410 Gone means our resourceVersion fell out of the watch window, so
+                # re-LIST. Anything else is treated like a dropped connection.
+                if e.status == 410:
+                    relist = True
+            except Exception:
+                # Dropped connections, and events the client could not decode.
+                # A failed re-LIST leaves relist set so it is retried.
+                pass
+            self._stopped.wait(next(delays))
+
+    def _watch(self):
+        _, core_client = get_clients()
+
+        @wraps(core_client.list_namespaced_pod)
+        def list_namespaced_pod(*args, **kwargs):
+            # Keep hold of the watch response so stop() can close it
+            resp = core_client.list_namespaced_pod(*args, **kwargs)
+            with self.lock:
+                self._watch_resp = resp
+                if self._stopped.is_set():
+                    _close_stream(resp)
+            return resp
+
+        # Watch is not thread-safe, so every stream gets its own
+        w = watch.Watch()
+        try:
+            for event in w.stream(
+                list_namespaced_pod,
+                namespace=self.namespace,
+                label_selector=self.label_selector,
+                field_selector=self.field_selector,
+                resource_version=self.rv,
+                allow_watch_bookmarks=True,
+                **_watch_timeouts(WATCH_TIMEOUT_SECS),
+            ):
+                # Watch yields None for blank or undecodable lines
+                if event is not None:
+                    self.apply(event)
+        finally:
+            with self.lock:
+                self._watch_resp = None
+            w.stop()
+
+    def apply(self, event):
+        """Apply a single ADDED/MODIFIED/DELETED/BOOKMARK watch event"""
+        with self.lock:
+            if event["type"] == "BOOKMARK":
+                self.rv = event["raw_object"]["metadata"]["resourceVersion"]
+                return
+
+            pod = event["object"]
+            if event["type"] == "DELETED":
+                self.pods.pop(pod.metadata.name, None)
+                self.statuses.pop(pod.metadata.name, None)
+            else:
+                self.pods[pod.metadata.name] = pod
+                self.statuses[pod.metadata.name] = _index_statuses(pod)
+            self.rv = pod.metadata.resource_version
+            self.changed.notify_all()
+
+    def list(self) -> List["client.models.v1_pod.V1Pod"]:
+        with self.lock:
+            return list(self.pods.values())
+
+    def first(self) -> Optional["client.models.v1_pod.V1Pod"]:
+        """The first cached pod, or None, without copying the pod list"""
+        with self.lock:
+            return next(iter(self.pods.values()), None)
+
+    def container_status(self, pod_name, status_field, container_name):
+        """O(1) lookup of a container's status, raises KeyError if it is not reported yet"""
+        with self.lock:
+            return self.statuses[pod_name][status_field][container_name]
+
+    def notify(self):
+        """Wake every wait_for() so it re-checks its predicate"""
+        with self.changed:
+            self.changed.notify_all()
+
+    def wait_for(self, predicate, timeout=None) -> bool:
+        """Block until predicate() is true, re-checking it after every cache update.
+        Returns the last result of predicate(), which is falsy if timeout elapsed.
+
+        raises PodWatchError if the watch thread has died or the cache was stopped"""
+
+        def ready():
+            if self.error is not None:
+                raise PodWatchError(f"Pod watch failed: {self.error!r}") from self.error
+            if self._stopped.is_set():
+                raise PodWatchError("Pod watch was stopped")
+            return predicate()
+
+        with self.changed:
+            return self.changed.wait_for(ready, timeout)
+
+
+def _index_statuses(pod):
+    """Index a pod's (init)container statuses by status field and container name"""
+    if not pod.status:
+        return {}
+    return {
+        status_field: {
+            status.name: status for status in (getattr(pod.status, status_field) or ())
+        }
+        for status_field in ("init_container_statuses", "container_statuses")
+    }
+
+
 class JobWatcher:
     def __init__(
         self,
@@ -58,6 +416,7 @@ class JobWatcher:
         job_active_wait_secs=1,
         job_active_wait_timeout=100,
         default_container="default",
+        max_log_requests=5,
     ):
         self.namespace = namespace
         self.name = name
@@ -65,15 +424,47 @@ class JobWatcher:
         self.job_active_wait_timeout = job_active_wait_timeout
         self.job_object = None
         self.default_container = default_container
+        self.max_log_requests = max_log_requests
+        self._pod_cache = None
+        # Followed containers first read the pods from the pool's threads at the same time
+        self._pod_cache_lock = Lock()
+        self._follows = _LogFollows()
+        self._ensure_job()
 
     @property
     def job(self):
         """Singleton for the associated v1_job.V1Job k8s API object"""
         if self.job_object:
             return self.job_object
+        batch_client, _ = get_clients()
         self.job_object = batch_client.read_namespaced_job(self.name, self.namespace)
         return self.job_object
-        return self._fetch_job()
+
+    def _ensure_job(self):
+        """Fetch the Job once and keep what is derived from its immutable spec"""
+        pod_spec = self.job.spec.template.spec
+        self._containers = tuple(pod_spec.containers or ())
+        self._init_containers = tuple(pod_spec.init_containers or ())
+
+        # The pod selectors never change for a Job, so build them once here.
+        # controller-uid pins the selector to this Job rather than any
+        # earlier Job that reused the name.
+        self._label_selector = (
+            f"job-name={self.name},controller-uid={self.job.metadata.uid}"
+        )
+        # When the pod template pins a node, every pod of the Job runs there,
+        # so let the API server filter on spec.nodeName as well.
+        self._field_selector = (
+            f"spec.nodeName={pod_spec.node_name}" if pod_spec.node_name else None
+        )
+
+        # One connection per concurrently followed container, one for the
+        # initContainer being followed, plus the pod and Job watches.
+        _ensure_pool_size(
+            min(self.max_log_requests, len(self._containers))
+            + bool(self._init_containers)
+            + 2
+        )
 
     def wait_for_active_job(self) -> "client.models.v1_job.V1Job":
         """Blocks until the job is active
@@ -82,60 +473,154 @@ class JobWatcher:
         timeout = time.time() + self.job_active_wait_timeout
 
         job = self.job
+        if _job_is_active(job):
+            return job
 
-        if job.status.failed or job.status.succeeded:
-            raise NoActiveJob("This job has already run!")
+        try:
+            job = self._watch_for_active_job(timeout)
+        except ApiException:
+            # Not every client is allowed to watch Jobs (e.g. RBAC without the
+            # watch verb), fall back to polling for the rest of the timeout.
+            job = self._poll_for_active_job(timeout)
+
+        self.job_object = job
+        return job
 
-        # Keep refreshing the job with calls to the k8s API
-        # until the timeout is reached. Occasionally a job
-        # will stay in the pending state until there are
-        # more resources available in the cluster
-        while not job.status.active:
+    def _watch_for_active_job(self, timeout) -> "client.models.v1_job.V1Job":
+        """Watch the job until it becomes active. Occasionally a job
+        will stay in the pending state until there are
+        more resources available in the cluster. The watch starts from the
+        resourceVersion of the Job we already read, so the API server only
+        sends changes made since then rather than replaying the Job.
+        """
+        batch_client, _ = get_clients()
+        rv = self.job.metadata.resource_version
+        delays = _backoff_delays()
+        while time.time() < timeout:
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    batch_client.list_namespaced_job,
+                    namespace=self.namespace,
+                    field_selector=f"metadata.name={self.name}",
+                    resource_version=rv,
+                    **_watch_timeouts(max(int(timeout - time.time()), 1)),
+                ):
+                    # Watch yields None for blank or undecodable lines
+                    if event is None:
+                        continue
+                    if event["type"] == "DELETED":
+                        raise NoActiveJob("This job was deleted!")
+                    if _job_is_active(event["object"]):
+                        return event["object"]
+                # The watch closed before the timeout, resume where it left off
+                rv = w.resource_version or rv
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                # 410 Gone: rv is too old to watch from, so read the Job
+                # again and watch from its current resourceVersion
+                job = batch_client.read_namespaced_job(self.name, self.namespace)
+                if _job_is_active(job):
+                    return job
+                rv = job.metadata.resource_version
+            except HTTPError:
+                # The connection dropped or went dead and hit the client read
+                # timeout, back off then resume the watch where it left off
+                rv = w.resource_version or rv
+                time.sleep(min(next(delays), max(timeout - time.time(), 0)))
+            finally:
+                # Release the stream's connection as soon as we are done with it
+                w.stop()
+
+        raise ActiveJobTimeout()
+
+    def _poll_for_active_job(self, timeout) -> "client.models.v1_job.V1Job":
+        """Keep refreshing the job with calls to the k8s API
+        until it is active or the timeout is reached.
+        """
+        batch_client, _ = get_clients()
+        job = batch_client.read_namespaced_job(self.name, self.namespace)
+        # Check back quickly at first, then back off to one read every job_active_wait_secs
+        delays = _backoff_delays(cap=self.job_active_wait_secs)
+        while not _job_is_active(job):
             if time.time() > timeout:
                 raise ActiveJobTimeout()
 
-            time.sleep(self.job_active_wait_secs)
+            time.sleep(next(delays))
             job = batch_client.read_namespaced_job(self.name, self.namespace)
 
         return job
 
+    @property
+    def pod_cache(self) -> _PodCache:
+        """The watch-backed cache of the Job's pods, started on first use and kept until close()"""
+        with self._pod_cache_lock:
+            if not self._pod_cache:
+                pod_cache = _PodCache(
+                    self.namespace, self._label_selector, self._field_selector
+                )
+                pod_cache.start()
+                self._pod_cache = pod_cache
+            return self._pod_cache
+
+    def _wait_for(self, predicate, timeout=None):
+        """pod_cache.wait_for() that raises ContainerLogCancelled once the follows are cancelled"""
+
+        def ready():
+            self._follows.check()
+            return predicate()
+
+        return self.pod_cache.wait_for(ready, timeout)
+
     @property
     def pods(self):
         """Returns the pod(s) spawned by a Job.
         Often called to refresh the pod object while waiting
         for a Pod's status to go from Pending to Active.
+        Reads from the pod cache, so this does not issue a request to the API server.
 
-        raises PodNotFound if a pod with the label-selector job-name=<Job.name>
-        cannot be found
+        raises PodNotFound if a pod with the label-selector
+        job-name=<Job.name>,controller-uid=<Job.uid> cannot be found
         """
-        pods = core_client.list_namespaced_pod(
-            namespace=self.namespace, label_selector="job-name={}".format(self.name)
-        ).items
+        pods = self.pod_cache.list()
 
         if not pods:
             raise PodNotFound(
-                f"Pod with label-selector job-name={self.name} not found!"
+                f"Pod with label-selector {self.pod_cache.label_selector} not found!"
             )
 
         return pods
 
-    def _refresh_pods(self):
-        """Fetch the Pod object from the kubernetes API. Called when waiting on a status change."""
-        return core_client.list_namespaced_pod(
-            namespace=self.namespace, label_selector="job-name={}".format(self.name)
-        ).items
+    @property
+    def pod(self):
+        """Returns the first pod spawned by a Job, which is the one that gets watched.
+        Cheaper than pods[0] on the status polling paths as it doesn't copy the pod list.
+
+        raises PodNotFound if the Job has no pods
+        """
+        pod = self.pod_cache.first()
+
+        if pod is None:
+            raise PodNotFound(
+                f"Pod with label-selector {self.pod_cache.label_selector} not found!"
+            )
+
+        return pod
 
     @property
-    def containers(self) -> List["kubernetes.client.models.v1_container.V1Container"]:
-        """Helper to fetch the container spec(s) from a V1Job"""
-        return self.job.spec.template.spec.containers
+    def containers(
+        self,
+    ) -> Tuple["kubernetes.client.models.v1_container.V1Container", ...]:
+        """The container spec(s) from the V1Job"""
+        return self._containers
 
     @property
     def init_containers(
         self,
-    ) -> Optional[List["kubernetes.client.models.v1_container.V1Container"]]:
-        """Helper to fetch the initContainer spec(s) from a V1Job"""
-        return self.job.spec.template.spec.init_containers
+    ) -> Tuple["kubernetes.client.models.v1_container.V1Container", ...]:
+        """The initContainer spec(s) from the V1Job, empty if there are none"""
+        return self._init_containers
 
     def print_container_logs(
         self,
@@ -143,36 +628,91 @@ class JobWatcher:
         is_init_container=False,
         wait_secs=10,
         timeout_secs=30,
-        pod_availability_retries=10,
+        pod_availability_timeout=10,
+        log_prefix=None,
     ):
-        """Prints the logs of the container to stdout then follows new logs until the container is terminated
+        """Prints the logs of the container to stdout then follows new logs until the container is terminated.
+        Returns the container's final (terminated) status.
+        If log_prefix is given every log line is written as "[<log_prefix>] <line>".
+        The pod gets pod_availability_timeout seconds to report a status for the container.
 
+        raises PodUnavailable if the container has no status within pod_availability_timeout
         raises ContainerLogTimeout if logs cannot be fetched within timeout"""
         timeout = time.time() + timeout_secs
 
-        pod = self.pods[0]
+        pod = self.pod
         # check_pod_running(pod)
 
-        container_status = None
-        retries = pod_availability_retries
-        while not container_status and retries >= 0:
+        def available():
             try:
-                container_status = self.fetch_container_status(
+                return self.fetch_container_status(
                     container, is_init_container=is_init_container
                 )
-            except PodUnavailable as e:
-                if retries == 0:
-                    raise e
-                retries -= 1
-                time.sleep(1)
+            except PodUnavailable:
+                return None
+
+        # Wake as soon as the pod watch delivers the container's status
+        container_status = self._wait_for(available, timeout=pod_availability_timeout)
+        if not container_status:
+            # Raises PodUnavailable
+            container_status = self.fetch_container_status(
+                container, is_init_container=is_init_container
+            )
 
         # We only want to tail logs when the container is running and exit after the container has terminated.
         # The container can be in a pending state waiting for resources or for an
         # initContainer to run.
-        exit_thread = Thread(
-            target=wait_for_termination, args=[self, container, is_init_container]
+        self._wait_container_started(
+            container_status, is_init_container, timeout, wait_secs
+        )
+
+        # Copy the raw log bytes straight to stdout as they arrive rather than
+        # decoding and printing them line by line. Without since_seconds the API
+        # server returns the container's whole log, which is all we want.
+        _, core_client = get_clients()
+        resp = core_client.read_namespaced_pod_log(
+            name=pod.metadata.name,
+            namespace=self.namespace,
+            container=container,
+            follow=True,
+            _preload_content=False,
         )
-        exit_thread.start()
+        # cancel() closes the stream if it is blocked waiting for more logs
+        self._follows.add(resp)
+        # Anything print()ed so far must reach stdout before the raw bytes
+        sys.stdout.flush()
+        chunks = resp.stream(LOG_CHUNK_SIZE)
+        if log_prefix:
+            chunks = _prefix_lines(chunks, f"[{log_prefix}] ".encode())
+        try:
+            for chunk in chunks:
+                self._follows.check()
+                _log_writer.write(chunk)
+        finally:
+            self._follows.discard(resp)
+            resp.release_conn()
+            # The container's logs are done, don't leave them behind output printed after
+            _log_writer.flush()
+        # The log stream closes when the container exits, but the pod status
+        # can lag behind, so wait for the watch to report the termination.
+        return wait_for_termination(self, container, is_init_container)
+
+    def _wait_container_started(
+        self, container_status, is_init_container, timeout, wait_secs
+    ):
+        """Blocks until the container is running or terminated, woken by the pod watch.
+        wait_secs only bounds how often the waiting message is printed.
+
+        raises ContainerLogTimeout if the container has not started by timeout"""
+        container = container_status.name
+
+        def started():
+            # Hand back the status itself so it doesn't need fetching again
+            status = self.fetch_container_status(
+                container, is_init_container=is_init_container
+            )
+            return status if status.state.running or status.state.terminated else None
+
         while not (container_status.state.running or container_status.state.terminated):
             if time.time() > timeout:
                 raise ContainerLogTimeout(
@@ -182,35 +722,31 @@ class JobWatcher:
             print(
                 f"Waiting on container to be in running or terminated state. Current state: {container_status.state}"
             )
-            time.sleep(wait_secs)
-            container_status = self.fetch_container_status(
+            container_status = self._wait_for(
+                started, timeout=min(wait_secs, max(timeout - time.time(), 0))
+            ) or self.fetch_container_status(
                 container, is_init_container=is_init_container
             )
 
-        for e in watch_client.stream(
-            core_client.read_namespaced_pod_log,
-            name=pod.metadata.name,
-            namespace=self.namespace,
-            container=container,
-            since_seconds=1000000,
-        ):
-            print(e)
-        exit_thread.join()
+        return container_status
 
     def fetch_container_status(self, container_name, is_init_container=False):
         """Helper to fetch the container status attribute for a given container name within a Pod"""
-        pod = self._refresh_pods()[0]
+        pod = self.pod
         status_field = (
             "init_container_statuses" if is_init_container else "container_statuses"
         )
         if not pod.status:
             raise PodUnavailable("Pod was unavailable")
 
-        return list(
-            filter(
-                lambda x: x.name == container_name, getattr(pod.status, status_field)
+        try:
+            return self.pod_cache.container_status(
+                pod.metadata.name, status_field, container_name
+            )
+        except KeyError:
+            raise PodUnavailable(
+                f"Pod has not reported a status for container {container_name} yet"
             )
-        )[0]
 
     def watch(self, watched_containers=[], log_init_containers=None) -> int:
         """
@@ -219,69 +755,133 @@ class JobWatcher:
 
         Containers are iterated through in the order they are specified in their manifests
         as kubernetes does not guarantee a start order (other than initContainers preceeding Containers)
+
+        The pod cache is stopped when watching is done, see close()
         """
-        exit_statuses = {"init_containers": {}, "containers": {}}
+        try:
+            return self._watch_containers(watched_containers, log_init_containers)
+        finally:
+            self.close()
+
+    def close(self):
+        """Stop the pod cache's watch. Reading the pods after this starts a new cache."""
+        with self._pod_cache_lock:
+            pod_cache, self._pod_cache = self._pod_cache, None
+        if pod_cache:
+            pod_cache.stop()
+
+    def _watch_containers(self, watched_containers, log_init_containers) -> int:
+        # Only the scalar fields of the last known container states are kept, the
+        # V1ContainerStatus models are slow to repr and mostly noise.
+        report = {"init_containers": {}, "containers": {}}
         if self.init_containers and log_init_containers:
             print("printing init container logs")
             for ic in self.init_containers:
                 print(f"---- initContainer: {ic.name}")
-                self.print_container_logs(container=ic.name, is_init_container=True)
-                exit_statuses["init_containers"][ic.name] = self.fetch_container_status(
-                    ic.name,
-                    is_init_container=True,
+                report["init_containers"][ic.name] = _exit_report(
+                    self.print_container_logs(container=ic.name, is_init_container=True)
                 )
 
         if self.containers:
-            # Only print logs for selected containers
-            for c in filter(lambda c: c.name in watched_containers, self.containers):
+            # Only print logs for selected containers. Unlike initContainers these run
+            # side by side, so follow them concurrently rather than one after another.
+            wanted = frozenset(watched_containers)
+            selected = [c for c in self.containers if c.name in wanted]
+            for c in selected:
                 print(f"------ container logs for container {c.name} ------")
-                self.print_container_logs(container=c.name)
-                exit_statuses["containers"][c.name] = self.fetch_container_status(
-                    c.name,
-                    is_init_container=False,
-                )
+            if len(selected) == 1:
+                # Nothing to run alongside, don't start a thread for it
+                final_statuses = [self.print_container_logs(container=selected[0].name)]
+            elif selected:
+                final_statuses = self._follow_concurrently(selected)
+            else:
+                final_statuses = []
+
+            for c, status in zip(selected, final_statuses):
+                report["containers"][c.name] = _exit_report(status)
 
         print("------ Container Statuses ------")
-        # Print last known container states
-        pprint.pprint(exit_statuses)
-
-        exit_codes = {
-            "init_containers": {
-                init_container: status.state.terminated.exit_code
-                for (init_container, status) in exit_statuses["init_containers"].items()
-            },
-            "containers": {
-                container: status.state.terminated.exit_code
-                for (container, status) in exit_statuses["containers"].items()
-            },
-        }
-        print("------ Container Exit Codes ------")
-        pprint.pprint(exit_codes)
-
-        if watched_containers:
-            non_zero = [
-                ret_code
-                for (container_name, ret_code) in exit_codes["containers"].items()
-                if ret_code != 0 and container_name in watched_containers
-            ]
-            if non_zero:
-                return non_zero.pop(0)
-        else:
-            non_zero = [
-                ret_code
-                for (_, ret_code) in exit_codes["containers"].items()
-                if ret_code != 0
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+        # Only selected containers are in the report, return the first nonzero exit code
+        return next(
+            (
+                status["exit_code"]
+                for status in report["containers"].values()
+                if status["exit_code"] != 0
+            ),
+            0,
+        )
+
+    def _follow_concurrently(self, containers):
+        """Follow the containers' logs side by side and return their final statuses.
+        The first follow to fail cancels the rest and its error is raised at once."""
+        # Each follow holds a connection open, so cap how many run at once
+        # like kubectl's --max-log-requests
+        executor = ThreadPoolExecutor(
+            max_workers=min(self.max_log_requests, len(containers))
+        )
+        try:
+            # Several streams share stdout, so tag each line with its container
+            futures = [
+                executor.submit(
+                    self.print_container_logs, container=c.name, log_prefix=c.name
+                )
+                for c in containers
             ]
-            if non_zero:
-                return non_zero.pop(0)
-        return 0
+            done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+            # result() re-raises anything raised while following the container
+            for future in done:
+                future.result()
+            return [future.result() for future in futures]
+        finally:
+            # Only has an effect when a follow failed, the others are all done otherwise
+            self._follows.cancel()
+            if self._pod_cache:
+                self._pod_cache.notify()
+            executor.shutdown(cancel_futures=True)
+            # Later follows on this watcher must not start out cancelled
+            self._follows = _LogFollows()
+
+
+def _prefix_lines(chunks, prefix):
+    """Prefix every line in a stream of byte chunks. A trailing partial line is
+    held back until its newline arrives, so streams sharing stdout only ever
+    interleave whole lines"""
+    pending = b""
+    for chunk in chunks:
+        lines, newline, pending = (pending + chunk).rpartition(b"\n")
+        if newline:
+            yield prefix + lines.replace(b"\n", b"\n" + prefix) + newline
+    if pending:
+        yield prefix + pending + b"\n"
+
+
+def _job_is_active(job):
+    """Whether a Job has active pods, raises NoActiveJob if it has already finished.
+    A Job retrying a failed pod has failed pods but is not finished, only its
+    Complete or Failed condition says it is done."""
+    if job.status.active:
+        return True
+    for condition in job.status.conditions or ():
+        if condition.type in ("Complete", "Failed") and condition.status == "True":
+            raise NoActiveJob("This job has already run!")
+    return False
+
+
+def _exit_report(container_status):
+    """The fields of a terminated container's status that end up in the report"""
+    terminated = container_status.state.terminated
+    return {"exit_code": terminated.exit_code, "reason": terminated.reason}
 
 
 def check_pod_running(pod):
     """Rasies if a pod is not available (Unschedulable or stuck in Unknown, Pending phases"""
-    last_condition = pod.status.conditions.pop()
+    # Read rather than pop() the last condition so the cached pod is left intact
+    last_condition = pod.status.conditions[-1] if pod.status.conditions else None
     # TODO: Update this with more failure scenarios, potentially wait on pending?
-    if last_condition.reason in ["Unschedulable"]:
+    if last_condition and last_condition.reason in ["Unschedulable"]:
         raise PodUnavailable(
             f"Pod could not be scheduled. Message: {last_condition.message}"
         )
@@ -293,14 +893,16 @@ def check_pod_running(pod):
 
 
 def wait_for_termination(watcher, container, is_init_container=False):
-    """Wait until a container has exited"""
-    while True:
-        container_status = watcher.fetch_container_status(
+    """Wait until a container has exited and return its final status.
+    Woken by the pod watch rather than polling"""
+
+    def terminated():
+        status = watcher.fetch_container_status(
             container, is_init_container=is_init_container
         )
-        if container_status.state.terminated:
-            break
-        time.sleep(1)
+        return status if status.state.terminated else None
+
+    return watcher._wait_for(terminated)
 
 
 def main():
@@ -328,13 +930,22 @@ def main():
         action="store_true",
         default=False,
     )
+    parser.add_argument(
+        "--max-log-requests",
+        help="Maximum number of containers to follow logs from concurrently",
+        default=5,
+        type=int,
+    )
     parsed_args = parser.parse_args()
+    if parsed_args.max_log_requests < 1:
+        parser.error("--max-log-requests must be at least 1")
     namespace = parsed_args.namespace
     job_name = parsed_args.job_name
     containers = parsed_args.containers
     init_logs = parsed_args.init_logs
+    max_log_requests = parsed_args.max_log_requests
 
-    watcher = JobWatcher(namespace, job_name)
+    watcher = JobWatcher(namespace, job_name, max_log_requests=max_log_requests)
     try:
         return_code = watcher.watch(
             watched_containers=containers, log_init_containers=init_logs